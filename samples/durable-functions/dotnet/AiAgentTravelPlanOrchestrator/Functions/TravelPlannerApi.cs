@@ -78,7 +78,19 @@ public class TravelPlannerApi
             return notFoundResponse;
         }
 
+        // The status only changes when the instance is updated, so let polling clients
+        // revalidate with If-None-Match instead of downloading the full plan every time
+        var etag = $"\"{status.LastUpdatedAt.UtcTicks:x}\"";
+        if (req.Headers.TryGetValues("If-None-Match", out var ifNoneMatch) && ifNoneMatch.Contains(etag))
+        {
+            var notModifiedResponse = req.CreateResponse(HttpStatusCode.NotModified);
+            notModifiedResponse.Headers.Add("ETag", etag);
+            return notModifiedResponse;
+        }
+
         var response = req.CreateResponse(HttpStatusCode.OK);
+        response.Headers.Add("ETag", etag);
+        response.Headers.Add("Cache-Control", "no-cache");
         await response.WriteAsJsonAsync(status);
         return response;
     }
@@ -58,11 +58,12 @@ public class TravelPlannerOrchestrator
             
         logger.LogInformation("Selected top destination: {DestinationName}", topDestination.DestinationName);
 
-        // Step 2: Create an itinerary for the selected destination
-        logger.LogInformation("Step 2: Creating itinerary for {DestinationName}", topDestination.DestinationName);
+        // Steps 2 & 3: Create an itinerary and get local recommendations in parallel.
+        // Both only depend on the selected destination, so they can be fanned out.
+        logger.LogInformation("Steps 2 & 3: Creating itinerary and getting local recommendations for {DestinationName}", topDestination.DestinationName);
         context.SetCustomStatus(new {
-            step = "CreateItinerary",
-            message = $"Creating a detailed itinerary for {topDestination.DestinationName}...",
+            step = "CreateItineraryAndLocalRecommendations",
+            message = $"Creating a detailed itinerary and finding local hidden gems in {topDestination.DestinationName}...",
             progress = 30,
             destination = topDestination.DestinationName
         });
@@ -72,30 +73,25 @@ public class TravelPlannerOrchestrator
             travelRequest.Budget,
             travelRequest.TravelDates,
             travelRequest.SpecialRequirements);
-            
-        var itinerary = await context.CallActivityAsync<TravelItinerary>(
-            nameof(TravelPlannerActivities.CreateItinerary),
-            itineraryRequest);
 
-        // Step 3: Get local recommendations
-        logger.LogInformation("Step 3: Getting local recommendations for {DestinationName}", topDestination.DestinationName);
-        context.SetCustomStatus(new {
-            step = "GetLocalRecommendations",
-            message = $"Finding local hidden gems and recommendations in {topDestination.DestinationName}...",
-            progress = 50,
-            destination = topDestination.DestinationName
-        });
         var localRecommendationsRequest = new LocalRecommendationsRequest(
             topDestination.DestinationName,
             travelRequest.DurationInDays,
             "Any", // Default value for preferred cuisine
             true,  // Include hidden gems
             travelRequest.SpecialRequirements.Contains("family", StringComparison.OrdinalIgnoreCase)); // Check if family-friendly
-            
-        var localRecommendations = await context.CallActivityAsync<LocalRecommendations>(
+
+        var itineraryTask = context.CallActivityAsync<TravelItinerary>(
+            nameof(TravelPlannerActivities.CreateItinerary),
+            itineraryRequest);
+        var localRecommendationsTask = context.CallActivityAsync<LocalRecommendations>(
             nameof(TravelPlannerActivities.GetLocalRecommendations),
             localRecommendationsRequest);
 
+        await Task.WhenAll(itineraryTask, localRecommendationsTask);
+        var itinerary = itineraryTask.Result;
+        var localRecommendations = localRecommendationsTask.Result;
+
         // Combine all results into a comprehensive travel plan
         var travelPlan = new TravelPlan(destinationRecommendations, itinerary, localRecommendations);
         
@@ -42,6 +42,9 @@ public abstract class BaseAgentService : IAgentService
     protected readonly JsonSerializerOptions JsonOptions;
     protected readonly ILogger<BaseAgentService> Logger;
 
+    // The agents client (and its credential and HTTP pipeline) is created once per service and reused across calls
+    private readonly Lazy<PersistentAgentsClient> _agentsClient;
+
     // Retry configuration
     private const int MaxRetryAttempts = 5;
     private const int InitialRetryDelayMs = 1000; // Start with a 1 second delay
@@ -62,6 +65,8 @@ public abstract class BaseAgentService : IAgentService
             PropertyNameCaseInsensitive = true,
             AllowTrailingCommas = true
         };
+
+        _agentsClient = new Lazy<PersistentAgentsClient>(CreateAgentsClient);
     }
 
     /// <summary>
@@ -179,27 +184,7 @@ public abstract class BaseAgentService : IAgentService
 
             try
             {
-                // Create a client using the connection string
-                if (string.IsNullOrEmpty(ConnectionString))
-                {
-                    throw new InvalidOperationException($"Connection string for agent {AgentId} is not set.");
-                }
-
-                // Create an agents client with the connection string (endpoint)
-                var tenantId = Environment.GetEnvironmentVariable("AZURE_TENANT_ID");
-                var clientId = Environment.GetEnvironmentVariable("AZURE_CLIENT_ID");
-
-                ArgumentNullException.ThrowIfNullOrEmpty(tenantId, nameof(tenantId));
-                ArgumentNullException.ThrowIfNullOrEmpty(clientId, nameof(clientId));
-
-                var projectClient = new AIProjectClient(new Uri(ConnectionString), new DefaultAzureCredential(
-                    new DefaultAzureCredentialOptions
-                    {
-                        TenantId = tenantId,
-                        ManagedIdentityClientId = clientId
-                    }));
-                var client = projectClient.GetPersistentAgentsClient();
-                Logger.LogInformation($"Successfully created PersistentAgentsClient for agent {AgentId}");
+                var client = _agentsClient.Value;
 
                 // Create a thread
                 PersistentAgentThread thread = await client.Threads.CreateThreadAsync();
@@ -282,6 +267,33 @@ public abstract class BaseAgentService : IAgentService
         throw new Exception($"Failed to get a response from agent {AgentId} after {MaxRetryAttempts} attempts");
     }
 
+    private PersistentAgentsClient CreateAgentsClient()
+    {
+        // Create a client using the connection string
+        if (string.IsNullOrEmpty(ConnectionString))
+        {
+            throw new InvalidOperationException($"Connection string for agent {AgentId} is not set.");
+        }
+
+        // Create an agents client with the connection string (endpoint)
+        var tenantId = Environment.GetEnvironmentVariable("AZURE_TENANT_ID");
+        var clientId = Environment.GetEnvironmentVariable("AZURE_CLIENT_ID");
+
+        ArgumentNullException.ThrowIfNullOrEmpty(tenantId, nameof(tenantId));
+        ArgumentNullException.ThrowIfNullOrEmpty(clientId, nameof(clientId));
+
+        var projectClient = new AIProjectClient(new Uri(ConnectionString), new DefaultAzureCredential(
+            new DefaultAzureCredentialOptions
+            {
+                TenantId = tenantId,
+                ManagedIdentityClientId = clientId
+            }));
+        var client = projectClient.GetPersistentAgentsClient();
+        Logger.LogInformation($"Successfully created PersistentAgentsClient for agent {AgentId}");
+
+        return client;
+    }
+
     private async Task<int> HandleRetry(int retryCount, int retryDelay, string errorMessage)
     {
         // Calculate exponential backoff with jitter
@@ -190,10 +190,17 @@ async def send_message(req: func.HttpRequest, client) -> func.HttpResponse:
     durable_client = client
 
     try:
-        body = req.get_json()
-        user_message = body.get("message", "Hello")
+        body = req.get_json() or {}
     except ValueError:
-        user_message = "Hello"
+        body = {}
+
+    if not isinstance(body, dict):
+        return func.HttpResponse(
+            json.dumps({"sessionId": session_id, "error": "Request body must be a JSON object"}),
+            mimetype="application/json",
+            status_code=400,
+        )
+    user_message = body.get("message", "Hello")
 
     correlation_id = uuid.uuid4().hex
     channel = f"chat:{session_id}:{correlation_id}"
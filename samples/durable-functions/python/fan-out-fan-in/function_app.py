@@ -6,18 +6,15 @@ import json
 app = func.FunctionApp(http_auth_level=func.AuthLevel.ANONYMOUS)
 bp = df.Blueprint()
 
+# Work items are fixed, so build them once instead of on every orchestrator replay
+WORK_ITEMS = tuple(f"item-{i}" for i in range(5))
+
 
 @bp.orchestration_trigger(context_name="context")
 def fan_out_fan_in_orchestration(context: df.DurableOrchestrationContext):
     """Fan-out/Fan-in orchestration that processes items in parallel."""
-    # Generate work items
-    work_items = [f"item-{i}" for i in range(5)]
-
     # Fan-out: schedule all activities in parallel
-    parallel_tasks = []
-    for item in work_items:
-        task = context.call_activity("process_item", item)
-        parallel_tasks.append(task)
+    parallel_tasks = [context.call_activity("process_item", item) for item in WORK_ITEMS]
 
     # Fan-in: wait for all to complete
     results = yield context.task_all(parallel_tasks)
@@ -30,10 +27,10 @@ def fan_out_fan_in_orchestration(context: df.DurableOrchestrationContext):
 @bp.activity_trigger(input_name="item")
 def process_item(item: str) -> int:
     """Process a single work item and return a score."""
-    logging.info(f"Processing: {item}")
+    logging.info("Processing: %s", item)
     # Simulate processing - return length of item name as "score"
     score = len(item) * 10
-    logging.info(f"Processed {item} with score: {score}")
+    logging.info("Processed %s with score: %s", item, score)
     return score
 
 
@@ -33,7 +33,7 @@ def fan_out_fan_in_orchestration(context: df.DurableOrchestrationContext):
 @app.activity_trigger(input_name="city")
 def say_hello(city: str) -> str:
     """Activity function that returns a greeting for a city."""
-    logging.info(f"Saying hello to {city}.")
+    logging.info("Saying hello to %s.", city)
     return f"Hello {city}!"
 
 
@@ -66,7 +66,7 @@ def counter_orchestration(context: df.DurableOrchestrationContext):
 @bp.activity_trigger(input_name="name")
 def say_hello(name: str) -> str:
     """Simple activity that returns a greeting."""
-    logging.info(f"say_hello called with: {name}")
+    logging.info("say_hello called with: %s", name)
     return f"Hello, {name}!"
 
 
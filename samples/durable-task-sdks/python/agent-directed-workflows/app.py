@@ -177,8 +177,7 @@ async def get_history(session_id: str):
         return JSONResponse({"error": "Session not found"}, status_code=404)
     raw_state = entity.get_state()
     if isinstance(raw_state, str):
-        import json as _json
-        state = _json.loads(raw_state)
+        state = json.loads(raw_state)
     elif isinstance(raw_state, dict):
         state = raw_state
     else:
@@ -6,7 +6,8 @@ within an orchestration. They are durable and can be retried on failure.
 
 import json
 import logging
-from typing import Any, Dict, List, Optional, cast
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, cast
 
 from durabletask import task
 
@@ -18,6 +19,67 @@ logger = logging.getLogger(__name__)
 # Configuration
 MAX_PAPERS_TO_ANALYZE = 15
 DEFAULT_RELEVANCE_SCORE = 5
+MAX_PAPERS_PER_FINDING = 5
+MAX_PAPERS_IN_REPORT = 15
+
+# System prompts are constant so that every request for a given activity starts
+# with an identical prefix, which lets the serving side reuse its prompt cache.
+ANALYZE_SYSTEM_PROMPT = (
+    "You are a research evaluation agent. Analyze arXiv papers and provide structured "
+    "insights in JSON format. Focus on technical depth and research value."
+)
+RESEARCH_GAPS_SYSTEM_PROMPT = (
+    "You are a research agent. Generate focused follow-up queries for arXiv search. "
+    "Return only JSON."
+)
+DECIDE_CONTINUATION_SYSTEM_PROMPT = (
+    "You are a research decision agent. Evaluate research completeness and decide "
+    "whether to continue. Return JSON."
+)
+SYNTHESIZE_SYSTEM_PROMPT = (
+    "You are a research assistant. Write clear, concise research summaries in markdown "
+    "format. Do not wrap the response in JSON."
+)
+
+# Structured output schemas. Strict mode constrains decoding to the schema, so
+# responses always have the expected shape (all properties must be required).
+_STRING_ARRAY: Dict[str, Any] = {"type": "array", "items": {"type": "string"}}
+ANALYZE_SCHEMA: Dict[str, Any] = {
+    "name": "paper_analysis",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "insights": _STRING_ARRAY,
+            "relevance_score": {"type": "number"},
+            "summary": {"type": "string"},
+            "key_points": _STRING_ARRAY,
+            "research_gaps": _STRING_ARRAY,
+        },
+        "required": ["insights", "relevance_score", "summary", "key_points", "research_gaps"],
+        "additionalProperties": False,
+    },
+}
+RESEARCH_GAPS_SCHEMA: Dict[str, Any] = {
+    "name": "follow_up_queries",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {"queries": _STRING_ARRAY},
+        "required": ["queries"],
+        "additionalProperties": False,
+    },
+}
+DECIDE_CONTINUATION_SCHEMA: Dict[str, Any] = {
+    "name": "continuation_decision",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {"should_continue": {"type": "boolean"}},
+        "required": ["should_continue"],
+        "additionalProperties": False,
+    },
+}
 
 
 # =============================================================================
@@ -30,9 +92,7 @@ def _format_paper_for_prompt(index: int, paper: Dict[str, Any]) -> str:
     title = paper.get("title", "No title")
     arxiv_id = paper.get("arxiv_id", "")
     authors_list = paper.get("authors", [])
-    authors = ", ".join(authors_list[:3])
-    if len(authors_list) > 3:
-        authors += " et al."
+    authors = ", ".join(authors_list[:3]) + (" et al." if len(authors_list) > 3 else "")
     summary = paper.get("summary", "")[:500]
     categories = ", ".join(paper.get("categories", [])[:3])
     published = paper.get("published", "")[:10]
@@ -50,6 +110,11 @@ def _format_paper_for_prompt(index: int, paper: Dict[str, Any]) -> str:
     )
 
 
+def _format_papers_for_prompt(papers: List[Dict[str, Any]]) -> str:
+    """Format a numbered list of papers for inclusion in an LLM prompt."""
+    return "\n".join(_format_paper_for_prompt(i, p) for i, p in enumerate(papers, 1))
+
+
 def _format_finding_for_prompt(finding: Dict[str, Any], include_relevance: bool = False) -> str:
     """Format a research finding for inclusion in an LLM prompt."""
     lines = [
@@ -89,19 +154,25 @@ def _extract_paper_metadata(paper: Dict[str, Any]) -> Dict[str, Any]:
 # =============================================================================
 
 
-def search_arxiv_activity(ctx: task.ActivityContext, query: str) -> List[Dict[str, Any]]:
+def search_arxiv_activity(ctx: task.ActivityContext, activity_input: Dict[str, Any]) -> List[Dict[str, Any]]:
     """Activity: Search arXiv for papers about a topic.
     
     Args:
         ctx: Activity context
-        query: Search query string
+        activity_input: Dictionary with query and optional exclude_ids
+            (arXiv IDs already analyzed in earlier iterations)
         
     Returns:
-        List of paper dictionaries
+        List of paper dictionaries not in exclude_ids
     """
+    query = activity_input["query"]
+    exclude_ids = set(activity_input.get("exclude_ids", []))
+
     logger.info(f"Searching arXiv for: {query}")
     papers = search_arxiv(query, max_results=30)
-    logger.info(f"Found {len(papers)} papers")
+    if exclude_ids:
+        papers = [p for p in papers if p.get("arxiv_id") not in exclude_ids]
+    logger.info(f"Found {len(papers)} new papers")
     return papers
 
 
@@ -123,44 +194,33 @@ def analyze_papers_activity(ctx: task.ActivityContext, activity_input: Dict[str,
 
     # Format papers for the LLM prompt
     papers_to_analyze = papers[:MAX_PAPERS_TO_ANALYZE]
-    papers_lines = [_format_paper_for_prompt(i + 1, p) for i, p in enumerate(papers_to_analyze)]
+    papers_text = _format_papers_for_prompt(papers_to_analyze)
     top_papers = [_extract_paper_metadata(p) for p in papers_to_analyze]
-    papers_text = "\n".join(papers_lines)
     
-    prompt = f"""
-    You are a research agent evaluating arXiv papers for: {topic}
-
-    Query used: {query}
-
-    Papers found:
-    {papers_text}
-
-    Provide a DETAILED analysis of these research papers. Focus on:
-    - Key research contributions, methodologies, and techniques
-    - Specific experimental results, metrics, or benchmarks
-    - Novel approaches, architectures, or algorithms proposed
-    - Connections between papers and emerging research themes
-    - Identified research gaps or open problems
-    - Practical applications and potential impact
-    - Most influential or highly relevant papers for this topic
+    prompt = f"""Topic: {topic}
+Query: {query}
+
+Papers:
+{papers_text}
+Analyze these papers: contributions, methods, results, themes across papers, and open problems.
+
+Return JSON with:
+- "insights": up to 8 specific technical insights (strings)
+- "relevance_score": 1-10, relevance of these papers to the topic
+- "summary": 2-3 sentence summary of the research landscape
+- "key_points": up to 5 most important findings
+- "research_gaps": up to 5 gaps or future directions
+"""
 
-    Return JSON with:
-    - "insights": String array of specific, technical insights from the papers
-    - "relevance_score": Number 1-10 (how relevant are these papers to the research topic)
-    - "summary": Brief summary of the research landscape
-    - "key_points": Array of most important research findings
-    - "research_gaps": Array of identified gaps or future research directions
-    """
-    
     messages = [
         {
             "role": "system",
-            "content": "You are a research evaluation agent. Analyze arXiv papers and provide structured insights in JSON format. Focus on technical depth and research value.",
+            "content": ANALYZE_SYSTEM_PROMPT,
         },
         {"role": "user", "content": prompt},
     ]
     
-    response = call_llm(messages)
+    response = call_llm(messages, schema=ANALYZE_SCHEMA)
     try:
         evaluation_dict: Dict[str, Any] = parse_json_response(response)
     except json.JSONDecodeError as e:
@@ -217,30 +277,30 @@ def identify_research_gaps_activity(ctx: task.ActivityContext, activity_input: D
     GOOD examples: ["transformer attention mechanisms", "neural network pruning", "federated learning privacy"]
     BAD examples: ["What are the latest advances in transformer-based architectures for natural language processing?"]
     
-    Return only a JSON array of SHORT keyword queries: ["query1", "query2", "query3"]
+    Return JSON with:
+    - "queries": array of SHORT keyword queries, e.g. ["query1", "query2", "query3"]
     """
     
     messages = [
         {
             "role": "system",
-            "content": "You are a research agent. Generate focused follow-up queries for arXiv search. Return only JSON array.",
+            "content": RESEARCH_GAPS_SYSTEM_PROMPT,
         },
         {"role": "user", "content": prompt},
     ]
     
-    response = call_llm(messages)
+    response = call_llm(messages, schema=RESEARCH_GAPS_SCHEMA)
     try:
         parsed: Any = parse_json_response(response)
-        if not isinstance(parsed, list):
-            return None
-        parsed_list = cast(List[Any], parsed)
-        queries: List[str] = [str(q) for q in parsed_list]
     except json.JSONDecodeError as e:
         logger.warning(f"Failed to parse follow-up queries JSON: {e}")
         return None
-    if len(queries) > 0:
-        return queries[0]
-    return None
+    if not isinstance(parsed, dict):
+        return None
+    queries: Any = cast(Dict[str, Any], parsed).get("queries")
+    if not isinstance(queries, list) or not queries:
+        return None
+    return str(cast(List[Any], queries)[0])
 
 
 def decide_continuation_activity(ctx: task.ActivityContext, activity_input: Dict[str, Any]) -> bool:
@@ -298,18 +358,17 @@ def decide_continuation_activity(ctx: task.ActivityContext, activity_input: Dict
     messages = [
         {
             "role": "system",
-            "content": "You are a research decision agent. Evaluate research completeness and decide whether to continue. Return JSON.",
+            "content": DECIDE_CONTINUATION_SYSTEM_PROMPT,
         },
         {"role": "user", "content": prompt},
     ]
     
-    raw_response = call_llm(messages)
+    raw_response = call_llm(messages, schema=DECIDE_CONTINUATION_SCHEMA)
     try:
-        json_response: Dict[str, Any] = parse_json_response(raw_response)
-    except json.JSONDecodeError as e:
+        result: bool = parse_json_response(raw_response)["should_continue"]
+    except (json.JSONDecodeError, KeyError, TypeError) as e:
         logger.warning(f"Failed to parse should_continue JSON: {e}, defaulting to False")
-        json_response = {}
-    result: bool = json_response.get("should_continue", False)
+        return False
     return result
 
 
@@ -352,7 +411,7 @@ Keep it concise and readable. Use markdown formatting."""
     messages = [
         {
             "role": "system",
-            "content": "You are a research assistant. Write clear, concise research summaries in markdown format. Do not wrap the response in JSON.",
+            "content": SYNTHESIZE_SYSTEM_PROMPT,
         },
         {"role": "user", "content": prompt},
     ]
@@ -379,27 +438,24 @@ def _build_findings_summary(all_findings: List[Dict[str, Any]]) -> str:
     return "\n".join(lines)
 
 
-def _build_papers_list(all_findings: List[Dict[str, Any]]) -> str:
-    """Build a deduplicated list of papers with links."""
+def _iter_unique_papers(all_findings: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Yield each finding's top papers once, skipping repeated arXiv IDs."""
     seen_ids: set[str] = set()
-    papers: List[str] = []
-
     for finding in all_findings:
-        for paper in finding.get("top_papers", [])[:5]:  # Limit papers per finding
+        for paper in finding.get("top_papers", [])[:MAX_PAPERS_PER_FINDING]:
             arxiv_id = paper.get("arxiv_id", "")
             if arxiv_id and arxiv_id not in seen_ids:
                 seen_ids.add(arxiv_id)
-                title = paper.get("title", "Unknown")
-                url = paper.get("abs_url", f"https://arxiv.org/abs/{arxiv_id}")
-                authors = paper.get("authors", [])
-                author_str = authors[0] if authors else "Unknown"
-                if len(authors) > 1:
-                    author_str += " et al."
-                papers.append(f"- {title} ({author_str}) - {url}")
-
-            if len(papers) >= 15:  # Cap total papers
-                break
-        if len(papers) >= 15:
-            break
+                yield paper
+
+
+def _build_papers_list(all_findings: List[Dict[str, Any]]) -> str:
+    """Build a deduplicated list of papers with links."""
+    papers: List[str] = []
+    for paper in islice(_iter_unique_papers(all_findings), MAX_PAPERS_IN_REPORT):
+        authors = paper.get("authors", [])
+        author_str = (authors[0] + (" et al." if len(authors) > 1 else "")) if authors else "Unknown"
+        url = paper.get("abs_url", f"https://arxiv.org/abs/{paper['arxiv_id']}")
+        papers.append(f"- {paper.get('title', 'Unknown')} ({author_str}) - {url}")
 
     return "\n".join(papers) if papers else "No papers found"
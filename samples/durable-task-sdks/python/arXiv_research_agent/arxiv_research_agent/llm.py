@@ -62,6 +62,8 @@ def _get_client() -> OpenAI:
             DefaultAzureCredential(),
             "https://cognitiveservices.azure.com/.default",
         )
+        # Acquire the first token now; the provider caches it until it nears expiry
+        token_provider()
         _client = OpenAI(base_url=base_url, api_key=token_provider)
 
     return _client
@@ -73,6 +75,7 @@ def call_llm(
     temperature: float = DEFAULT_TEMPERATURE,
     max_tokens: int = DEFAULT_MAX_TOKENS,
     json_output: bool = True,
+    schema: Optional[Dict[str, Any]] = None,
 ) -> str:
     """Make an LLM API call using Azure OpenAI's Responses API.
 
@@ -82,13 +85,16 @@ def call_llm(
         temperature: Sampling temperature (0.0-1.0)
         max_tokens: Maximum tokens in response
         json_output: If True, request structured JSON output
+        schema: Optional JSON schema format ('name', 'schema', 'strict') that
+            the JSON output must conform to
 
     Returns:
         The LLM response content as a string
 
     Raises:
         RuntimeError: If client initialization fails
-        ValueError: If the LLM returns an empty response
+        ValueError: If the LLM returns an empty response, or an incomplete one
+            when json_output is set
         Exception: If the API call fails
     """
     client = _get_client()
@@ -98,12 +104,16 @@ def call_llm(
 
     try:
         if json_output:
+            if schema is not None:
+                text_format: Dict[str, Any] = {"type": "json_schema", **schema}
+            else:
+                text_format = {"type": "json_object"}
             response = client.responses.create(  # type: ignore[attr-defined]
                 model=model,
                 input=input_text,
                 temperature=temperature,
                 max_output_tokens=max_tokens,
-                text={"format": {"type": "json_object"}},
+                text={"format": text_format},
             )
         else:
             response = client.responses.create(  # type: ignore[attr-defined]
@@ -113,6 +123,12 @@ def call_llm(
                 max_output_tokens=max_tokens,
             )
 
+        # Structured responses cut off by max_output_tokens (or content filtering)
+        # are unparseable; free-text responses are returned as-is
+        if json_output and getattr(response, "status", None) == "incomplete":
+            details = getattr(response, "incomplete_details", None)
+            raise ValueError(f"LLM returned incomplete response: {details}")
+
         content: Optional[str] = response.output_text  # type: ignore[attr-defined]
         if not content:
             raise ValueError("LLM returned empty response")
@@ -43,7 +43,7 @@ def paper_research_orchestrator(
 
     Args:
         ctx: Orchestration context
-        workflow_input: Dictionary with main_topic and query
+        workflow_input: Dictionary with main_topic, query and optional exclude_ids
 
     Yields:
         Activity calls for searching and analyzing
@@ -53,13 +53,14 @@ def paper_research_orchestrator(
     """
     main_topic = workflow_input["main_topic"]
     query = workflow_input["query"]
+    exclude_ids = workflow_input.get("exclude_ids", [])
     
     logger.info(f"Starting paper research for query: {query}")
     
-    # Step 1: Search arXiv for papers
+    # Step 1: Search arXiv for papers not analyzed in an earlier iteration
     papers = yield ctx.call_activity(
         "search_arxiv_activity",
-        input=query,
+        input={"query": query, "exclude_ids": exclude_ids},
         retry_policy=ARXIV_RETRY_POLICY
     )
     
@@ -178,10 +179,18 @@ def arxiv_research_orchestrator(
     current_iteration += 1
     logger.info(f"Starting iteration {current_iteration}/{max_iterations}")
 
+    # Skip papers that earlier iterations already sent to the LLM
+    seen_ids = sorted({
+        paper["arxiv_id"]
+        for finding in all_findings
+        for paper in finding.get("top_papers", [])
+        if paper.get("arxiv_id")
+    })
+
     # Research papers for the current query using a sub-orchestration
     analysis = yield ctx.call_sub_orchestrator(
         "paper_research_orchestrator",
-        input={"main_topic": topic, "query": current_query}
+        input={"main_topic": topic, "query": current_query, "exclude_ids": seen_ids}
     )
     all_findings.append(analysis)
 
@@ -7,10 +7,12 @@ tasks from the Durable Task Scheduler.
 import asyncio
 import logging
 import os
+import signal
 
 from durabletask.azuremanaged.worker import DurableTaskSchedulerWorker
 
 from .auth import get_credential
+from .llm import _get_client
 
 from .activities import (
     search_arxiv_activity,
@@ -44,6 +46,13 @@ async def main() -> None:
     logger.info(f"Using endpoint: {endpoint}")
     
     credential = get_credential()
+
+    # Create the LLM client up front so the first activity does not pay for
+    # client setup and token acquisition
+    try:
+        _get_client()
+    except Exception as e:
+        logger.warning(f"Could not initialize LLM client at startup: {e}")
     
     # Create worker
     with DurableTaskSchedulerWorker(
@@ -69,11 +78,20 @@ async def main() -> None:
         # Start the worker
         worker.start()
         
+        # Shared shutdown idiom across the Python samples: wait for SIGINT/SIGTERM
+        stop_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop_event.set)
+            except NotImplementedError:
+                pass  # Windows: no signal handlers, Ctrl+C raises KeyboardInterrupt
+
         try:
             # Keep the worker running
             logger.info("Worker is running. Press Ctrl+C to stop.")
-            while True:
-                await asyncio.sleep(1)
+            await stop_event.wait()
+            logger.info("Worker shutdown initiated")
         except KeyboardInterrupt:
             logger.info("Worker shutdown initiated")
     
@@ -9,6 +9,7 @@ from arxiv_research_agent.activities import (
     identify_research_gaps_activity,
     decide_continuation_activity,
     synthesize_research_activity,
+    RESEARCH_GAPS_SCHEMA,
 )
 
 
@@ -20,17 +21,29 @@ class TestSearchArxivActivity:
         """Test that activity returns papers from API."""
         mock_search.return_value = sample_papers
         
-        result = search_arxiv_activity(mock_activity_context, "deep learning")
+        result = search_arxiv_activity(mock_activity_context, {"query": "deep learning"})
         
         assert result == sample_papers
         mock_search.assert_called_once_with("deep learning", max_results=30)
 
+    @patch("arxiv_research_agent.activities.search_arxiv")
+    def test_search_excludes_seen_papers(self, mock_search, mock_activity_context, sample_papers):
+        """Test that papers analyzed in earlier iterations are filtered out."""
+        mock_search.return_value = sample_papers
+        
+        result = search_arxiv_activity(
+            mock_activity_context,
+            {"query": "deep learning", "exclude_ids": [sample_papers[0]["arxiv_id"]]}
+        )
+        
+        assert result == sample_papers[1:]
+
     @patch("arxiv_research_agent.activities.search_arxiv")
     def test_search_empty_results(self, mock_search, mock_activity_context):
         """Test that activity handles empty results."""
         mock_search.return_value = []
         
-        result = search_arxiv_activity(mock_activity_context, "nonexistent topic xyz")
+        result = search_arxiv_activity(mock_activity_context, {"query": "nonexistent topic xyz"})
         
         assert result == []
 
@@ -70,6 +83,53 @@ class TestAnalyzePapersActivity:
         assert "top_papers" in result
         assert result["query"] == "transformer attention"
 
+    @patch("arxiv_research_agent.activities.call_llm")
+    @patch("arxiv_research_agent.activities.parse_json_response")
+    def test_analyze_prompt_numbers_papers(
+        self,
+        mock_parse,
+        mock_llm,
+        mock_activity_context,
+        sample_papers
+    ):
+        """Test that papers are numbered and formatted in the prompt."""
+        mock_llm.return_value = "{}"
+        mock_parse.return_value = {}
+
+        analyze_papers_activity(
+            mock_activity_context,
+            {
+                "topic": "deep learning",
+                "query": "transformer attention",
+                "papers": sample_papers,
+            }
+        )
+
+        user_message = mock_llm.call_args.args[0][1]["content"]
+        assert "Paper 1:\n  Title: Deep Learning for Natural Language Processing" in user_message
+        assert "Paper 2:\n  Title: Reinforcement Learning in Robotics" in user_message
+        assert "Authors: John Smith, Jane Doe, Bob Wilson\n" in user_message
+
+    @patch("arxiv_research_agent.activities.call_llm")
+    def test_analyze_propagates_llm_failure(
+        self,
+        mock_llm,
+        mock_activity_context,
+        sample_papers
+    ):
+        """Test that an empty LLM response is raised so the activity is retried."""
+        mock_llm.side_effect = ValueError("LLM returned empty response")
+
+        with pytest.raises(ValueError):
+            analyze_papers_activity(
+                mock_activity_context,
+                {
+                    "topic": "deep learning",
+                    "query": "transformer attention",
+                    "papers": sample_papers,
+                }
+            )
+
     @patch("arxiv_research_agent.activities.call_llm")
     @patch("arxiv_research_agent.activities.parse_json_response")
     def test_analyze_handles_empty_papers(
@@ -113,8 +173,8 @@ class TestIdentifyResearchGapsActivity:
         sample_evaluation_result
     ):
         """Test that activity returns a follow-up query."""
-        mock_llm.return_value = '["transformer attention", "neural network optimization"]'
-        mock_parse.return_value = ["transformer attention", "neural network optimization"]
+        mock_llm.return_value = '{"queries": ["transformer attention", "neural network optimization"]}'
+        mock_parse.return_value = {"queries": ["transformer attention", "neural network optimization"]}
         
         result = identify_research_gaps_activity(
             mock_activity_context,
@@ -137,8 +197,8 @@ class TestIdentifyResearchGapsActivity:
         sample_evaluation_result
     ):
         """Test that activity handles empty query array."""
-        mock_llm.return_value = '[]'
-        mock_parse.return_value = []
+        mock_llm.return_value = '{"queries": []}'
+        mock_parse.return_value = {"queries": []}
         
         result = identify_research_gaps_activity(
             mock_activity_context,
@@ -152,17 +212,14 @@ class TestIdentifyResearchGapsActivity:
         assert result is None
 
     @patch("arxiv_research_agent.activities.call_llm")
-    @patch("arxiv_research_agent.activities.parse_json_response")
-    def test_identify_handles_non_list(
+    def test_identify_requests_queries_schema(
         self,
-        mock_parse,
         mock_llm,
         mock_activity_context,
         sample_evaluation_result
     ):
-        """Test that activity handles non-list response."""
-        mock_llm.return_value = '"single query"'
-        mock_parse.return_value = "single query"
+        """Test that activity constrains the response to the queries schema."""
+        mock_llm.return_value = '{"queries": ["single query"]}'
         
         result = identify_research_gaps_activity(
             mock_activity_context,
@@ -173,7 +230,53 @@ class TestIdentifyResearchGapsActivity:
             }
         )
         
-        assert result is None
+        assert result == "single query"
+        assert mock_llm.call_args.kwargs["schema"] is RESEARCH_GAPS_SCHEMA
+
+    @patch("arxiv_research_agent.activities.call_llm")
+    @patch("arxiv_research_agent.activities.parse_json_response")
+    def test_identify_handles_non_list(
+        self,
+        mock_parse,
+        mock_llm,
+        mock_activity_context,
+        sample_evaluation_result
+    ):
+        """Test that activity handles non-object and non-list responses."""
+        for parsed in ("single query", ["single query"], {"queries": "single query"}):
+            mock_parse.return_value = parsed
+            mock_llm.return_value = '"single query"'
+            
+            result = identify_research_gaps_activity(
+                mock_activity_context,
+                {
+                    "topic": "deep learning",
+                    "current_findings": [sample_evaluation_result],
+                    "iteration": 1
+                }
+            )
+            
+            assert result is None
+
+    @patch("arxiv_research_agent.activities.call_llm")
+    def test_identify_propagates_llm_failure(
+        self,
+        mock_llm,
+        mock_activity_context,
+        sample_evaluation_result
+    ):
+        """Test that an incomplete response is raised so the activity is retried."""
+        mock_llm.side_effect = ValueError("LLM returned incomplete response")
+        
+        with pytest.raises(ValueError):
+            identify_research_gaps_activity(
+                mock_activity_context,
+                {
+                    "topic": "deep learning",
+                    "current_findings": [sample_evaluation_result],
+                    "iteration": 1
+                }
+            )
 
 
 class TestDecideContinuationActivity:
@@ -229,6 +332,28 @@ class TestDecideContinuationActivity:
         
         assert result is False
 
+    @patch("arxiv_research_agent.activities.call_llm")
+    def test_decide_handles_truncated_response(
+        self,
+        mock_llm,
+        mock_activity_context,
+        sample_evaluation_result
+    ):
+        """Test that activity stops when the response cannot be parsed."""
+        mock_llm.return_value = '{"should_con'
+        
+        result = decide_continuation_activity(
+            mock_activity_context,
+            {
+                "topic": "deep learning",
+                "all_findings": [sample_evaluation_result],
+                "current_iteration": 1,
+                "max_iterations": 3
+            }
+        )
+        
+        assert result is False
+
     def test_decide_max_iterations_reached(
         self,
         mock_activity_context,
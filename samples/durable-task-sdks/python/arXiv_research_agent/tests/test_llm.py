@@ -70,6 +70,47 @@ class TestCallLlm:
         call_args = mock_openai_client.responses.create.call_args
         assert call_args.kwargs["model"] == DEFAULT_MODEL
 
+    def test_call_llm_json_object_format(self, mock_openai_client):
+        """Test that JSON mode is requested when no schema is given."""
+        call_llm([{"role": "user", "content": "Hello"}])
+
+        call_args = mock_openai_client.responses.create.call_args
+        assert call_args.kwargs["text"] == {"format": {"type": "json_object"}}
+
+    def test_call_llm_json_schema_format(self, mock_openai_client):
+        """Test that a schema is passed through as a json_schema format."""
+        schema = {
+            "name": "result",
+            "schema": {"type": "object", "properties": {}, "additionalProperties": False},
+            "strict": True,
+        }
+
+        call_llm([{"role": "user", "content": "Hello"}], schema=schema)
+
+        call_args = mock_openai_client.responses.create.call_args
+        assert call_args.kwargs["text"] == {"format": {"type": "json_schema", **schema}}
+
+    def test_call_llm_incomplete_response_raises(self, mock_openai_client):
+        """Test that a response cut off before completion is rejected."""
+        response = mock_openai_client.responses.create.return_value
+        response.status = "incomplete"
+        response.incomplete_details = {"reason": "max_output_tokens"}
+
+        with pytest.raises(ValueError) as exc_info:
+            call_llm([{"role": "user", "content": "Hello"}])
+
+        assert "incomplete" in str(exc_info.value)
+
+    def test_call_llm_incomplete_text_response_returned(self, mock_openai_client):
+        """Test that a cut-off free-text response is returned as-is."""
+        response = mock_openai_client.responses.create.return_value
+        response.status = "incomplete"
+        response.output_text = "# Partial report"
+
+        result = call_llm([{"role": "user", "content": "Hello"}], json_output=False)
+
+        assert result == "# Partial report"
+
     def test_call_llm_api_error(self, mock_openai_client):
         """Test LLM call handles API errors."""
         mock_openai_client.responses.create.side_effect = Exception("API Error")
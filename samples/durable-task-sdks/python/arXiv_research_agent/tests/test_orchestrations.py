@@ -23,7 +23,7 @@ class TestPaperResearchOrchestrator:
         assert next(gen) == "search_call"
         ctx.call_activity.assert_called_once_with(
             "search_arxiv_activity",
-            input="transformer attention",
+            input={"query": "transformer attention", "exclude_ids": []},
             retry_policy=ANY,
         )
 
@@ -68,7 +68,11 @@ class TestPaperResearchOrchestrator:
 
         ctx.call_activity.assert_has_calls(
             [
-                call("search_arxiv_activity", input="neural networks", retry_policy=ANY),
+                call(
+                    "search_arxiv_activity",
+                    input={"query": "neural networks", "exclude_ids": []},
+                    retry_policy=ANY,
+                ),
                 call(
                     "analyze_papers_activity",
                     input={
@@ -114,7 +118,7 @@ class TestArxivResearchOrchestrator:
         assert next(gen) == "sub_call"
         ctx.call_sub_orchestrator.assert_called_once_with(
             "paper_research_orchestrator",
-            input={"main_topic": "deep learning", "query": "deep learning"},
+            input={"main_topic": "deep learning", "query": "deep learning", "exclude_ids": []},
         )
 
         assert gen.send(analysis) == "decide_call"
@@ -283,7 +287,11 @@ class TestArxivResearchOrchestrator:
         ctx.call_activity = Mock(side_effect=["decide_call", "write_call"])
 
         # Simulate state passed from previous continue_as_new
-        previous_findings = [{"query": "initial query", "summary": "first iteration"}]
+        previous_findings = [{
+            "query": "initial query",
+            "summary": "first iteration",
+            "top_papers": [{"arxiv_id": "2301.67890v2"}, {"arxiv_id": "2301.12345v1"}],
+        }]
         input_data = {
             "topic": "deep learning",
             "max_iterations": 3,
@@ -294,11 +302,15 @@ class TestArxivResearchOrchestrator:
 
         gen = arxiv_research_orchestrator(ctx, input_data)
 
-        # Should use the current_query from state
+        # Should use the current_query from state and skip papers already analyzed
         assert next(gen) == "sub_call"
         ctx.call_sub_orchestrator.assert_called_once_with(
             "paper_research_orchestrator",
-            input={"main_topic": "deep learning", "query": "follow-up query"},
+            input={
+                "main_topic": "deep learning",
+                "query": "follow-up query",
+                "exclude_ids": ["2301.12345v1", "2301.67890v2"],
+            },
         )
 
 
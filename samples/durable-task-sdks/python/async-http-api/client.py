@@ -1,4 +1,5 @@
 import asyncio
+import json
 import logging
 import uuid
 import os
@@ -110,7 +111,6 @@ async def get_operation_status(operation_id: str):
     
     if status.runtime_status == durable_client.OrchestrationStatus.COMPLETED:
         # We need to parse the serialized_output if it exists
-        import json
         result = None
         if hasattr(status, 'serialized_output') and status.serialized_output:
             try:
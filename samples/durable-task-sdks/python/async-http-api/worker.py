@@ -2,6 +2,7 @@ import asyncio
 import logging
 import time
 import os
+from datetime import timedelta
 from azure.identity import DefaultAzureCredential
 from durabletask import task
 from durabletask.azuremanaged.worker import DurableTaskSchedulerWorker
@@ -12,16 +13,11 @@ logger = logging.getLogger(__name__)
 
 # Activity functions
 def process_long_running_operation(ctx, data: dict) -> dict:
-    """Activity that simulates a long-running operation."""
+    """Activity that completes a long-running operation once its processing time has elapsed."""
     logger.info(f"Processing long-running operation: {data}")
     operation_id = data.get("operation_id", "unknown")
-    # Simulate a long-running process
-    processing_time = data.get("processing_time", 5)
-    logger.info(f"Operation {operation_id} will take {processing_time} seconds")
-    
+
     # In a real-world scenario, this might be a call to an external service or system
-    time.sleep(processing_time)
-    
     return {
         "operation_id": operation_id,
         "status": "completed",
@@ -35,10 +31,17 @@ def async_http_api_orchestrator(ctx, input_data: dict) -> dict:
     Orchestrator that demonstrates the async HTTP API pattern.
     
     This orchestrator starts a long-running operation and returns its result.
+    The processing time is simulated with a durable timer rather than by
+    sleeping inside the activity, so no worker thread is held while waiting.
     """
     operation_id = input_data.get("operation_id", "unknown")
     logger.info(f"Starting async HTTP API orchestration for operation {operation_id}")
-    
+
+    # Simulate a long-running process
+    processing_time = input_data.get("processing_time", 5)
+    logger.info(f"Operation {operation_id} will take {processing_time} seconds")
+    yield ctx.create_timer(timedelta(seconds=processing_time))
+
     # Execute the long-running operation
     result = yield ctx.call_activity("process_long_running_operation", input=input_data)
     
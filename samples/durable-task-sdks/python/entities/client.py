@@ -2,7 +2,6 @@ import asyncio
 import logging
 import sys
 import os
-from azure.identity import DefaultAzureCredential, ManagedIdentityCredential
 from azure.core.exceptions import ClientAuthenticationError
 from durabletask import client as durable_client, entities
 from durabletask.azuremanaged.client import DurableTaskSchedulerClient
@@ -29,15 +28,15 @@ async def main():
     # Credential handling with better error management
     credential = None
     if endpoint != "http://localhost:8080":
+        # Only import azure.identity when a credential is actually needed
+        from azure.identity import DefaultAzureCredential, ManagedIdentityCredential
+        
         try:
             # Check if we're running in Azure with a managed identity
             client_id = os.getenv("AZURE_MANAGED_IDENTITY_CLIENT_ID")
             if client_id:
                 logger.info(f"Using Managed Identity with client ID: {client_id}")
                 credential = ManagedIdentityCredential(client_id=client_id)
-                # Test the credential to make sure it works
-                credential.get_token("https://management.azure.com/.default")
-                logger.info("Successfully authenticated with Managed Identity")
             else:
                 # Fall back to DefaultAzureCredential only if no client ID is available
                 logger.info("No client ID found, falling back to DefaultAzureCredential")
@@ -61,7 +60,6 @@ async def main():
     
     # Set up orchestration parameters
     TOTAL_ORCHESTRATIONS = 5  # Total number of orchestrations to run
-    INTERVAL_SECONDS = 5       # Time between orchestrations in seconds
     completed_orchestrations = 0
     failed_orchestrations = 0
     
@@ -87,54 +85,61 @@ async def main():
         # Now run orchestrations that interact with entities
         logger.info("=== Orchestration-based Entity Operations ===")
         
+        async def schedule_orchestration(i):
+            # Create a unique entity key for this orchestration
+            instance_entity_key = f"{entity_key}-orch-{i+1}"
+            logger.info(f"Scheduling orchestration #{i+1} for entity '{instance_entity_key}'")
+            
+            # The client is synchronous, so run the call in a worker thread
+            instance_id = await asyncio.to_thread(
+                client.schedule_new_orchestration,
+                "counter_workflow",
+                input=instance_entity_key
+            )
+            
+            logger.info(f"Orchestration #{i+1} scheduled with ID: {instance_id}")
+            return instance_id
+        
+        # Schedule all orchestrations concurrently
+        results = await asyncio.gather(
+            *(schedule_orchestration(i) for i in range(TOTAL_ORCHESTRATIONS)),
+            return_exceptions=True
+        )
+        
         instance_ids = []
-        for i in range(TOTAL_ORCHESTRATIONS):
-            try:
-                # Create a unique entity key for this orchestration
-                instance_entity_key = f"{entity_key}-orch-{i+1}"
-                logger.info(f"Scheduling orchestration #{i+1} for entity '{instance_entity_key}'")
-                
-                # Schedule the orchestration
-                instance_id = client.schedule_new_orchestration(
-                    "counter_workflow",
-                    input=instance_entity_key
-                )
-                
-                instance_ids.append(instance_id)
-                logger.info(f"Orchestration #{i+1} scheduled with ID: {instance_id}")
-                
-                # Wait before scheduling next orchestration (except for the last one)
-                if i < TOTAL_ORCHESTRATIONS - 1:
-                    logger.info(f"Waiting {INTERVAL_SECONDS} seconds before scheduling next orchestration...")
-                    await asyncio.sleep(INTERVAL_SECONDS)
-                
-            except Exception as e:
-                logger.error(f"Error scheduling orchestration #{i+1}: {e}")
+        for i, result in enumerate(results):
+            if isinstance(result, Exception):
+                failed_orchestrations += 1
+                logger.error(f"Error scheduling orchestration #{i+1}: {result}")
+            else:
+                instance_ids.append(result)
         
         logger.info(f"All {len(instance_ids)} orchestrations scheduled. Waiting for completion...")
         
-        # Wait for all orchestrations to complete
-        for idx, instance_id in enumerate(instance_ids):
-            try:
-                logger.info(f"Waiting for orchestration {idx+1}/{len(instance_ids)} (ID: {instance_id})...")
-                result = client.wait_for_orchestration_completion(
-                    instance_id,
-                    timeout=120
-                )
-                
-                if result:
-                    if result.runtime_status == durable_client.OrchestrationStatus.FAILED:
-                        failed_orchestrations += 1
-                        logger.error(f"Orchestration {instance_id} failed")
-                    elif result.runtime_status == durable_client.OrchestrationStatus.COMPLETED:
-                        completed_orchestrations += 1
-                        logger.info(f"Orchestration {instance_id} completed successfully with result: {result.serialized_output}")
-                    else:
-                        logger.info(f"Orchestration {instance_id} status: {result.runtime_status}")
+        # Wait for all orchestrations to complete concurrently, so the total wait is
+        # bounded by the slowest orchestration rather than the sum of all of them
+        results = await asyncio.gather(
+            *(
+                asyncio.to_thread(client.wait_for_orchestration_completion, instance_id, timeout=120)
+                for instance_id in instance_ids
+            ),
+            return_exceptions=True
+        )
+        
+        for instance_id, result in zip(instance_ids, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error waiting for orchestration {instance_id}: {result}")
+            elif result:
+                if result.runtime_status == durable_client.OrchestrationStatus.FAILED:
+                    failed_orchestrations += 1
+                    logger.error(f"Orchestration {instance_id} failed")
+                elif result.runtime_status == durable_client.OrchestrationStatus.COMPLETED:
+                    completed_orchestrations += 1
+                    logger.info(f"Orchestration {instance_id} completed successfully with result: {result.serialized_output}")
                 else:
-                    logger.warning(f"Orchestration {instance_id} did not complete within the timeout period")
-            except Exception as e:
-                logger.error(f"Error waiting for orchestration {instance_id}: {e}")
+                    logger.info(f"Orchestration {instance_id} status: {result.runtime_status}")
+            else:
+                logger.warning(f"Orchestration {instance_id} did not complete within the timeout period")
         
         logger.info(f"All orchestrations processed. Successful: {completed_orchestrations}, Failed: {failed_orchestrations}")
         
@@ -1,7 +1,7 @@
 import asyncio
 import logging
 import os
-from azure.identity import DefaultAzureCredential, ManagedIdentityCredential
+import signal
 from azure.core.exceptions import ClientAuthenticationError
 from durabletask import task, entities
 from durabletask.azuremanaged.worker import DurableTaskSchedulerWorker
@@ -15,24 +15,29 @@ logger = logging.getLogger(__name__)
 def counter(ctx: entities.EntityContext, input: int):
     """Function-based entity that maintains a counter state.
     
-    Supports operations: add, subtract, get, reset
+    Supports operations: add, subtract, apply, get, reset
     """
     state = ctx.get_state(int, 0)  # Get state with default 0
     
     if ctx.operation == "add":
         state += input
         ctx.set_state(state)
-        logger.info(f"Counter '{ctx.entity_id.key}': Added {input}, new value: {state}")
+        logger.info("Counter '%s': Added %s, new value: %s", ctx.entity_id.key, input, state)
     elif ctx.operation == "subtract":
         state -= input
         ctx.set_state(state)
-        logger.info(f"Counter '{ctx.entity_id.key}': Subtracted {input}, new value: {state}")
+        logger.info("Counter '%s': Subtracted %s, new value: %s", ctx.entity_id.key, input, state)
+    elif ctx.operation == "apply":
+        # Apply a batch of signed deltas in a single operation
+        state += sum(input)
+        ctx.set_state(state)
+        logger.info("Counter '%s': Applied %s, new value: %s", ctx.entity_id.key, input, state)
     elif ctx.operation == "get":
-        logger.info(f"Counter '{ctx.entity_id.key}': Current value: {state}")
+        logger.info("Counter '%s': Current value: %s", ctx.entity_id.key, state)
         return state
     elif ctx.operation == "reset":
         ctx.set_state(0)
-        logger.info(f"Counter '{ctx.entity_id.key}': Reset to 0")
+        logger.info("Counter '%s': Reset to 0", ctx.entity_id.key)
 
 
 # Orchestrator that interacts with the counter entity
@@ -41,17 +46,14 @@ def counter_workflow(ctx: task.OrchestrationContext, entity_key: str):
     
     This orchestration:
     1. Creates/accesses a counter entity
-    2. Adds values to the counter
+    2. Adds and subtracts values with a single batched signal
     3. Gets the current value
-    4. Subtracts a value
-    5. Returns the final count
+    4. Returns the final count
     """
     entity_id = entities.EntityInstanceId("counter", entity_key)
     
-    # Signal entity operations (fire-and-forget)
-    ctx.signal_entity(entity_id=entity_id, operation_name="add", input=10)
-    ctx.signal_entity(entity_id=entity_id, operation_name="add", input=5)
-    ctx.signal_entity(entity_id=entity_id, operation_name="subtract", input=3)
+    # Signal entity operation (fire-and-forget): add 10, add 5, subtract 3 in one message
+    ctx.signal_entity(entity_id=entity_id, operation_name="apply", input=[10, 5, -3])
     
     # Call entity and wait for result (note: call_entity uses 'entity' and 'operation' params)
     value = yield ctx.call_entity(entity=entity_id, operation="get")
@@ -62,7 +64,7 @@ def counter_workflow(ctx: task.OrchestrationContext, entity_key: str):
 # Activity to log entity state
 def log_entity_state(ctx: task.ActivityContext, message: str) -> str:
     """Activity function that logs messages."""
-    logger.info(f"Entity state log: {message}")
+    logger.info("Entity state log: %s", message)
     return message
 
 
@@ -80,15 +82,15 @@ async def main():
     # Credential handling with better error management
     credential = None
     if endpoint != "http://localhost:8080":
+        # Only import azure.identity when a credential is actually needed
+        from azure.identity import DefaultAzureCredential, ManagedIdentityCredential
+        
         try:
             # Check if we're running in Azure with a managed identity
             client_id = os.getenv("AZURE_MANAGED_IDENTITY_CLIENT_ID")
             if client_id:
                 logger.info(f"Using Managed Identity with client ID: {client_id}")
                 credential = ManagedIdentityCredential(client_id=client_id)
-                # Test the credential to make sure it works
-                credential.get_token("https://management.azure.com/.default")
-                logger.info("Successfully authenticated with Managed Identity")
             else:
                 # Fall back to DefaultAzureCredential only if no client ID is available
                 logger.info("No client ID found, falling back to DefaultAzureCredential")
@@ -113,10 +115,18 @@ async def main():
         # Start the worker (without awaiting)
         worker.start()
         
+        # Shared shutdown idiom across the Python samples: wait for SIGINT/SIGTERM
+        stop_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop_event.set)
+            except NotImplementedError:
+                pass  # Windows: no signal handlers, Ctrl+C raises KeyboardInterrupt
+
         try:
-            # Keep the worker running
-            while True:
-                await asyncio.sleep(1)
+            await stop_event.wait()
+            logger.info("Worker shutdown initiated")
         except KeyboardInterrupt:
             logger.info("Worker shutdown initiated")
             
@@ -1,4 +1,5 @@
 import asyncio
+import json
 import logging
 import uuid
 import os
@@ -80,7 +81,6 @@ async def get_request_status(request_id):
     
     # Add custom status if available
     if hasattr(status, 'serialized_custom_status') and status.serialized_custom_status:
-        import json
         try:
             if isinstance(status.serialized_custom_status, str):
                 custom_status = json.loads(status.serialized_custom_status)
@@ -92,7 +92,6 @@ async def get_request_status(request_id):
     
     # Add output if completed
     if status.runtime_status == durable_client.OrchestrationStatus.COMPLETED:
-        import json
         try:
             if hasattr(status, 'serialized_output') and status.serialized_output:
                 result["output"] = json.loads(status.serialized_output)
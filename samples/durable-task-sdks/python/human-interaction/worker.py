@@ -21,7 +21,7 @@ def submit_approval_request(ctx, request_data: dict) -> dict:
     requester = request_data.get("requester")
     item = request_data.get("item")
     
-    logger.info(f"Submitting approval request {request_id} from {requester} for {item}")
+    logger.info("Submitting approval request %s from %s for %s", request_id, requester, item)
     
     # In a real system, this would send an email, notification, or update a database
     return {
@@ -40,7 +40,7 @@ def process_approval(ctx, approval_data: dict) -> dict:
     approver = approval_data.get("approver")
     
     approval_status = "Approved" if is_approved else "Rejected"
-    logger.info(f"Processing {approval_status} request {request_id} by {approver}")
+    logger.info("Processing %s request %s by %s", approval_status, request_id, approver)
     
     # In a real system, this would update a database, trigger workflows, etc.
     return {
@@ -63,7 +63,7 @@ def human_interaction_orchestrator(ctx, input_data: dict) -> dict:
     item = input_data.get("item")
     timeout_hours = input_data.get("timeout_hours", 24)
     
-    logger.info(f"Starting human interaction orchestration for request {request_id}")
+    logger.info("Starting human interaction orchestration for request %s", request_id)
     
     # Submit the approval request
     request_data = {
@@ -96,7 +96,7 @@ def human_interaction_orchestrator(ctx, input_data: dict) -> dict:
         # Human responded in time
         # Get the event result - in the new SDK, we need to access the output of the task properly
         approval_data = yield approval_task
-        logger.info(f"Received approval response for request {request_id}")
+        logger.info("Received approval response for request %s", request_id)
         
         # Process the approval
         result = yield ctx.call_activity("process_approval", input={
@@ -106,7 +106,7 @@ def human_interaction_orchestrator(ctx, input_data: dict) -> dict:
         })
     else:
         # Timeout occurred
-        logger.info(f"Request {request_id} timed out waiting for approval")
+        logger.info("Request %s timed out waiting for approval", request_id)
         result = {
             "request_id": request_id,
             "status": "Timeout",
@@ -1,7 +1,8 @@
 import asyncio
+import json
 import logging
 import sys
-import uuid
+import secrets
 import os
 from azure.identity import DefaultAzureCredential
 from durabletask import client as durable_client
@@ -34,7 +35,7 @@ async def main():
     )
     
     # Generate a unique job ID or use one provided as an argument
-    job_id = sys.argv[1] if len(sys.argv) > 1 else f"job-{uuid.uuid4()}"
+    job_id = sys.argv[1] if len(sys.argv) > 1 else "job-" + secrets.token_hex(16)
     
     # Define monitoring parameters
     polling_interval = int(sys.argv[2]) if len(sys.argv) > 2 else 5  # seconds
@@ -77,7 +78,6 @@ async def main():
             # Display custom status updates if available and different from last update
             # Use serialized_custom_status instead of custom_status with proper parsing
             if hasattr(state, 'serialized_custom_status') and state.serialized_custom_status:
-                import json
                 try:
                     current_status = json.loads(state.serialized_custom_status)
                     if current_status != last_status:
@@ -21,7 +21,7 @@ def check_job_status(ctx, job_data: dict) -> dict:
     job_id = job_data.get("job_id", "unknown")
     check_count = job_data.get("check_count", 0)
     
-    logger.info(f"Checking status for job: {job_id} (check #{check_count+1})")
+    logger.info("Checking status for job: %s (check #%s)", job_id, check_count + 1)
     
     # Simulate job status
     if check_count >= 3:
@@ -48,39 +48,37 @@ def monitoring_job_orchestrator(ctx, job_data: dict) -> dict:
     polling_interval = job_data.get("polling_interval_seconds", 5)
     timeout = job_data.get("timeout_seconds", 30)
     
-    logger.info(f"Starting monitoring orchestration for job {job_id}")
-    logger.info(f"Polling interval: {polling_interval} seconds")
-    logger.info(f"Timeout: {timeout} seconds")
+    logger.info("Starting monitoring orchestration for job %s", job_id)
+    logger.info("Polling interval: %s seconds", polling_interval)
+    logger.info("Timeout: %s seconds", timeout)
     
     # Record the start time
     start_time = ctx.current_utc_datetime
     expiration_time = start_time + datetime.timedelta(seconds=timeout)
     
-    # Initialize monitoring state
-    job_status = {
-        "job_id": job_id,
-        "status": "Unknown",
-        "check_count": 0
-    }
+    # Initialize monitoring state; the same input dict is reused for every check
+    check_input = {"job_id": job_id, "check_count": 0}
     
     # Loop until the job completes or times out
     while True:
         # Check current job status
-        check_input = {"job_id": job_id, "check_count": job_status.get("check_count", 0)}
         job_status = yield ctx.call_activity("check_job_status", input=check_input)
+        status = job_status["status"]
+        check_count = job_status["check_count"]
+        check_input["check_count"] = check_count
         
         # Make the job status available to clients via custom status
         ctx.set_custom_status(job_status)
         
-        if job_status["status"] == "Completed":
-            logger.info(f"Job {job_id} completed after {job_status['check_count']} checks")
+        if status == "Completed":
+            logger.info("Job %s completed after %s checks", job_id, check_count)
             break
         
         # Check if we've hit the timeout
         current_time = ctx.current_utc_datetime
         if current_time >= expiration_time:
-            logger.info(f"Monitoring for job {job_id} timed out after {timeout} seconds")
-            job_status["status"] = "Timeout"
+            logger.info("Monitoring for job %s timed out after %s seconds", job_id, timeout)
+            status = "Timeout"
             break
         
         # Determine the next check time
@@ -91,14 +89,14 @@ def monitoring_job_orchestrator(ctx, job_data: dict) -> dict:
             next_check_time = expiration_time
         
         # Schedule the next check
-        logger.info(f"Waiting {polling_interval} seconds before next check of job {job_id}")
+        logger.info("Waiting %s seconds before next check of job %s", polling_interval, job_id)
         yield ctx.create_timer(next_check_time)
     
     # Return the final status
     return {
         "job_id": job_id,
-        "final_status": job_status["status"],
-        "checks_performed": job_status["check_count"],
+        "final_status": status,
+        "checks_performed": check_count,
         "monitoring_duration_seconds": (ctx.current_utc_datetime - start_time).total_seconds()
     }
 
@@ -6,6 +6,7 @@ All you need is to configure a TracerProvider with an exporter.
 """
 import asyncio
 import os
+import signal
 import time
 import logging
 
@@ -25,34 +26,48 @@ resource = Resource.create({"service.name": "DistributedTracingSample"})
 provider = TracerProvider(resource=resource)
 otlp_endpoint = os.environ.get("OTEL_EXPORTER_OTLP_ENDPOINT", "http://localhost:4317")
 exporter = OTLPSpanExporter(endpoint=otlp_endpoint, insecure=True)
+# Export small batches every second so traces show up quickly. These only fill
+# in unset OTEL_BSP_* variables, which BatchSpanProcessor reads itself.
+os.environ.setdefault("OTEL_BSP_MAX_QUEUE_SIZE", "512")
+os.environ.setdefault("OTEL_BSP_SCHEDULE_DELAY", "1000")
+os.environ.setdefault("OTEL_BSP_MAX_EXPORT_BATCH_SIZE", "128")
+os.environ.setdefault("OTEL_BSP_EXPORT_TIMEOUT", "5000")
 provider.add_span_processor(BatchSpanProcessor(exporter))
 trace.set_tracer_provider(provider)
 
+# Activities sleep briefly so their spans have visible durations in Jaeger.
+# Set SIMULATE_LATENCY=0 to skip the delays, e.g. when measuring throughput.
+SIMULATE_LATENCY = os.environ.get("SIMULATE_LATENCY", "1") == "1"
+
 
 # Activities — no manual span creation needed. The SDK wraps each
 # activity execution in an "activity:<name>" span automatically.
 
 def validate_order(ctx, order_id: str) -> str:
     logger.info(f"Validating order: {order_id}")
-    time.sleep(0.1)
+    if SIMULATE_LATENCY:
+        time.sleep(0.1)
     return f"Validated({order_id})"
 
 
 def process_payment(ctx, input: str) -> str:
     logger.info(f"Processing payment for: {input}")
-    time.sleep(0.2)
+    if SIMULATE_LATENCY:
+        time.sleep(0.2)
     return f"Paid({input})"
 
 
 def ship_order(ctx, input: str) -> str:
     logger.info(f"Shipping: {input}")
-    time.sleep(0.15)
+    if SIMULATE_LATENCY:
+        time.sleep(0.15)
     return f"Shipped({input})"
 
 
 def send_notification(ctx, input: str) -> str:
     logger.info(f"Notifying customer: {input}")
-    time.sleep(0.05)
+    if SIMULATE_LATENCY:
+        time.sleep(0.05)
     return f"Notified({input})"
 
 
@@ -83,12 +98,25 @@ async def main():
 
         logger.info("Worker started with OpenTelemetry tracing. Press Ctrl+C to exit.")
         w.start()
+
+        # Shared shutdown idiom across the Python samples: wait for SIGINT/SIGTERM
+        stop_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop_event.set)
+            except NotImplementedError:
+                pass  # Windows: no signal handlers, Ctrl+C raises KeyboardInterrupt
+
         try:
-            while True:
-                await asyncio.sleep(1)
+            await stop_event.wait()
+            logger.info("Worker shutdown initiated")
         except KeyboardInterrupt:
             logger.info("Worker shutdown initiated")
 
+    # Flush spans still queued in the batch processor before exiting
+    provider.shutdown()
+
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -1,29 +1,35 @@
 """Saga pattern worker — Travel booking with compensating transactions."""
 
 import asyncio
+import itertools
 import logging
 import os
-from datetime import datetime
+import signal
+import time
 
 from durabletask.azuremanaged.worker import DurableTaskSchedulerWorker
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
 logger = logging.getLogger(__name__)
 
+# Confirmation IDs are unique within the worker process, even for bookings made
+# in the same second
+_confirmation_ids = itertools.count(time.time_ns())
+
 
 # --- Activities: Booking ---
 
 def book_flight(ctx, input: dict) -> dict:
     """Book a flight. Simulates success or failure based on destination."""
     destination = input["destination"]
-    logger.info(f"Booking flight to {destination}...")
+    logger.info("Booking flight to %s...", destination)
 
     # Simulate: flights to "Nowhere" fail
     if destination.lower() == "nowhere":
         raise Exception(f"No flights available to {destination}")
 
-    confirmation = f"FL-{datetime.now().strftime('%Y%m%d%H%M%S')}"
-    logger.info(f"Flight booked: {confirmation}")
+    confirmation = f"FL-{next(_confirmation_ids):X}"
+    logger.info("Flight booked: %s", confirmation)
     return {"confirmation": confirmation, "service": "flight", "destination": destination}
 
 
@@ -31,27 +37,27 @@ def book_hotel(ctx, input: dict) -> dict:
     """Book a hotel. Simulates success or failure based on dates."""
     destination = input["destination"]
     nights = input.get("nights", 3)
-    logger.info(f"Booking hotel in {destination} for {nights} nights...")
+    logger.info("Booking hotel in %s for %s nights...", destination, nights)
 
     # Simulate: 0 nights fails
     if nights <= 0:
         raise Exception("Invalid hotel booking: 0 nights")
 
-    confirmation = f"HT-{datetime.now().strftime('%Y%m%d%H%M%S')}"
-    logger.info(f"Hotel booked: {confirmation}")
+    confirmation = f"HT-{next(_confirmation_ids):X}"
+    logger.info("Hotel booked: %s", confirmation)
     return {"confirmation": confirmation, "service": "hotel", "destination": destination}
 
 
 def book_car(ctx, input: dict) -> dict:
     """Book a rental car. Simulates failure when simulate_failure is True."""
     destination = input["destination"]
-    logger.info(f"Booking rental car in {destination}...")
+    logger.info("Booking rental car in %s...", destination)
 
     if input.get("simulate_car_failure", False):
         raise Exception(f"No rental cars available in {destination}")
 
-    confirmation = f"CR-{datetime.now().strftime('%Y%m%d%H%M%S')}"
-    logger.info(f"Car booked: {confirmation}")
+    confirmation = f"CR-{next(_confirmation_ids):X}"
+    logger.info("Car booked: %s", confirmation)
     return {"confirmation": confirmation, "service": "car", "destination": destination}
 
 
@@ -60,24 +66,28 @@ def book_car(ctx, input: dict) -> dict:
 def cancel_flight(ctx, input: dict) -> str:
     """Compensating action: cancel a flight booking."""
     confirmation = input["confirmation"]
-    logger.info(f"COMPENSATING: Cancelling flight {confirmation}")
+    logger.info("COMPENSATING: Cancelling flight %s", confirmation)
     return f"Flight {confirmation} cancelled"
 
 
 def cancel_hotel(ctx, input: dict) -> str:
     """Compensating action: cancel a hotel booking."""
     confirmation = input["confirmation"]
-    logger.info(f"COMPENSATING: Cancelling hotel {confirmation}")
+    logger.info("COMPENSATING: Cancelling hotel %s", confirmation)
     return f"Hotel {confirmation} cancelled"
 
 
 def cancel_car(ctx, input: dict) -> str:
     """Compensating action: cancel a car booking."""
     confirmation = input["confirmation"]
-    logger.info(f"COMPENSATING: Cancelling car {confirmation}")
+    logger.info("COMPENSATING: Cancelling car %s", confirmation)
     return f"Car {confirmation} cancelled"
 
 
+# Compensating activity for each booking step, in booking order
+COMPENSATIONS = (cancel_flight, cancel_hotel, cancel_car)
+
+
 # --- Orchestration ---
 
 def travel_booking_saga(ctx, input: dict):
@@ -89,23 +99,23 @@ def travel_booking_saga(ctx, input: dict):
     nights = input.get("nights", 3)
     simulate_car_failure = input.get("simulate_car_failure", False)
 
-    completed_bookings = []  # Stack of (booking_result, cancel_activity_name)
+    completed_bookings = []  # Booking results, indexed like COMPENSATIONS
 
     try:
         # Step 1: Book flight
         flight = yield ctx.call_activity(
             book_flight, input={"destination": destination})
-        completed_bookings.append((flight, cancel_flight))
+        completed_bookings.append(flight)
 
         # Step 2: Book hotel
         hotel = yield ctx.call_activity(
             book_hotel, input={"destination": destination, "nights": nights})
-        completed_bookings.append((hotel, cancel_hotel))
+        completed_bookings.append(hotel)
 
         # Step 3: Book car
         car = yield ctx.call_activity(
             book_car, input={"destination": destination, "simulate_car_failure": simulate_car_failure})
-        completed_bookings.append((car, cancel_car))
+        completed_bookings.append(car)
 
         # All succeeded!
         return {
@@ -120,12 +130,13 @@ def travel_booking_saga(ctx, input: dict):
 
     except Exception as e:
         # Compensation: undo completed bookings in reverse order
-        logger.info(f"Booking failed: {e}. Starting compensation...")
+        logger.info("Booking failed: %s. Starting compensation...", e)
         compensations = []
 
-        for booking, cancel_activity in reversed(completed_bookings):
+        for step in reversed(range(len(completed_bookings))):
             try:
-                result = yield ctx.call_activity(cancel_activity, input=booking)
+                result = yield ctx.call_activity(
+                    COMPENSATIONS[step], input=completed_bookings[step])
                 compensations.append(result)
             except Exception as comp_error:
                 compensations.append(f"Compensation failed: {comp_error}")
@@ -163,9 +174,18 @@ async def main():
         w.start()
         logger.info("Saga worker started. Press Ctrl+C to exit.")
 
+        # Shared shutdown idiom across the Python samples: wait for SIGINT/SIGTERM
+        stop_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop_event.set)
+            except NotImplementedError:
+                pass  # Windows: no signal handlers, Ctrl+C raises KeyboardInterrupt
+
         try:
-            while True:
-                await asyncio.sleep(1)
+            await stop_event.wait()
+            logger.info("Worker shutdown initiated")
         except KeyboardInterrupt:
             logger.info("Worker shutdown initiated")
 
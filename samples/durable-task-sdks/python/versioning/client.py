@@ -2,7 +2,6 @@ import asyncio
 import logging
 import sys
 import os
-from azure.identity import DefaultAzureCredential, ManagedIdentityCredential
 from durabletask.client import OrchestrationStatus
 from durabletask.azuremanaged.client import DurableTaskSchedulerClient
 
@@ -25,15 +24,15 @@ async def main():
     # Credential handling with better error management
     credential = None
     if endpoint != "http://localhost:8080":
+        # Only import azure.identity when a credential is actually needed
+        from azure.identity import DefaultAzureCredential, ManagedIdentityCredential
+        
         try:
             # Check if we're running in Azure with a managed identity
             client_id = os.getenv("AZURE_MANAGED_IDENTITY_CLIENT_ID")
             if client_id:
                 logger.info(f"Using Managed Identity with client ID: {client_id}")
                 credential = ManagedIdentityCredential(client_id=client_id)
-                # Test the credential to make sure it works
-                credential.get_token("https://management.azure.com/.default")
-                logger.info("Successfully authenticated with Managed Identity")
             else:
                 # Fall back to DefaultAzureCredential only if no client ID is available
                 logger.info("No client ID found, falling back to DefaultAzureCredential")
@@ -66,51 +65,56 @@ async def main():
         logger.info(f"Testing with name: {name}")
         logger.info("")
         
-        instance_ids = []
-        
-        # Schedule orchestrations with different versions
-        for version, description in versions_to_test:
+        async def schedule_version(version, description):
             logger.info(f"Scheduling orchestration with version {version}: {description}")
             
-            instance_id = dts_client.schedule_new_orchestration(
+            # The client is synchronous, so run the call in a worker thread
+            instance_id = await asyncio.to_thread(
+                dts_client.schedule_new_orchestration,
                 "versioned_orchestration",
                 input=name,
                 version=version
             )
             
-            instance_ids.append((version, instance_id, description))
             logger.info(f"  Instance ID: {instance_id}")
+            return (version, instance_id, description)
+        
+        # Schedule orchestrations with different versions concurrently
+        instance_ids = await asyncio.gather(
+            *(schedule_version(version, description) for version, description in versions_to_test)
+        )
         
         logger.info("")
         logger.info("Waiting for orchestrations to complete...")
         logger.info("")
         
-        # Wait for all orchestrations to complete
-        for version, instance_id, description in instance_ids:
-            try:
-                result = dts_client.wait_for_orchestration_completion(
-                    instance_id,
-                    timeout=60
-                )
-                
-                if result:
-                    if result.runtime_status == OrchestrationStatus.COMPLETED:
-                        logger.info(f"=== Version {version} ({description}) ===")
-                        logger.info(f"  Status: COMPLETED")
-                        logger.info(f"  Result: {result.serialized_output}")
-                    elif result.runtime_status == OrchestrationStatus.FAILED:
-                        logger.error(f"=== Version {version} ===")
-                        logger.error(f"  Status: FAILED")
-                        logger.error(f"  Error: {result.failure_details}")
-                    else:
-                        logger.warning(f"=== Version {version} ===")
-                        logger.warning(f"  Status: {result.runtime_status}")
+        # Wait for all orchestrations to complete concurrently
+        results = await asyncio.gather(
+            *(
+                asyncio.to_thread(dts_client.wait_for_orchestration_completion, instance_id, timeout=60)
+                for _, instance_id, _ in instance_ids
+            ),
+            return_exceptions=True
+        )
+        
+        for (version, instance_id, description), result in zip(instance_ids, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error waiting for version {version}: {result}")
+            elif result:
+                if result.runtime_status == OrchestrationStatus.COMPLETED:
+                    logger.info(f"=== Version {version} ({description}) ===")
+                    logger.info(f"  Status: COMPLETED")
+                    logger.info(f"  Result: {result.serialized_output}")
+                elif result.runtime_status == OrchestrationStatus.FAILED:
+                    logger.error(f"=== Version {version} ===")
+                    logger.error(f"  Status: FAILED")
+                    logger.error(f"  Error: {result.failure_details}")
                 else:
                     logger.warning(f"=== Version {version} ===")
-                    logger.warning(f"  Did not complete within timeout")
-                    
-            except Exception as e:
-                logger.error(f"Error waiting for version {version}: {e}")
+                    logger.warning(f"  Status: {result.runtime_status}")
+            else:
+                logger.warning(f"=== Version {version} ===")
+                logger.warning(f"  Did not complete within timeout")
         
         logger.info("")
         logger.info("=== Demo Complete ===")
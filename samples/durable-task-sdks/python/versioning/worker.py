@@ -1,8 +1,9 @@
 import asyncio
+import functools
 import logging
 import os
+import signal
 from packaging import version
-from azure.identity import DefaultAzureCredential, ManagedIdentityCredential
 from durabletask import task
 from durabletask.azuremanaged.worker import DurableTaskSchedulerWorker
 
@@ -11,32 +12,33 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-# Helper function to compare versions
-def compare_version(v1: str | None, v2: str) -> int:
-    """Compare two version strings.
+@functools.lru_cache(maxsize=256)
+def _parse(v: str) -> version.Version:
+    """Parse a version string, caching the result.
     
-    Returns:
-        -1 if v1 < v2
-         0 if v1 == v2
-         1 if v1 > v2
+    Orchestrations replay many times with the same version strings, so each
+    distinct string only needs to be parsed once per process.
     """
-    if v1 is None:
-        return -1
+    return version.parse(v)
+
+
+# Versions that gate new orchestration steps, parsed once at import
+_V2 = version.parse("2.0.0")
+_V3 = version.parse("3.0.0")
+
+
+def _version_ge(v: str | None, target: version.Version) -> bool:
+    """Return True if version string v is at or above the pre-parsed target.
+    
+    Orchestrations started without a version are treated as older than any target.
+    """
+    if v is None:
+        return False
     try:
-        ver1 = version.parse(v1)
-        ver2 = version.parse(v2)
-        if ver1 < ver2:
-            return -1
-        elif ver1 > ver2:
-            return 1
-        return 0
-    except Exception:
+        return _parse(v) >= target
+    except version.InvalidVersion:
         # Fall back to string comparison
-        if v1 < v2:
-            return -1
-        elif v1 > v2:
-            return 1
-        return 0
+        return v >= str(target)
 
 
 # Activity functions
@@ -80,12 +82,12 @@ def versioned_orchestration(ctx: task.OrchestrationContext, name: str):
     results.append(hello_result)
     
     # v2.0.0+: Added goodbye greeting
-    if compare_version(orch_version, "2.0.0") >= 0:
+    if _version_ge(orch_version, _V2):
         goodbye_result = yield ctx.call_activity(say_goodbye, input=name)
         results.append(goodbye_result)
     
     # v3.0.0+: Added notification
-    if compare_version(orch_version, "3.0.0") >= 0:
+    if _version_ge(orch_version, _V3):
         notification_message = f"Completed greeting workflow for {name}"
         notification_result = yield ctx.call_activity(send_notification, input=notification_message)
         results.append(notification_result)
@@ -103,22 +105,23 @@ async def main():
     # Get environment variables for taskhub and endpoint with defaults
     taskhub_name = os.getenv("TASKHUB", "default")
     endpoint = os.getenv("ENDPOINT", "http://localhost:8080")
+    is_local = endpoint == "http://localhost:8080"
 
     print(f"Using taskhub: {taskhub_name}")
     print(f"Using endpoint: {endpoint}")
     
     # Credential handling with better error management
     credential = None
-    if endpoint != "http://localhost:8080":
+    if not is_local:
+        # Only import azure.identity when a credential is actually needed
+        from azure.identity import DefaultAzureCredential, ManagedIdentityCredential
+        
         try:
             # Check if we're running in Azure with a managed identity
             client_id = os.getenv("AZURE_MANAGED_IDENTITY_CLIENT_ID")
             if client_id:
                 logger.info(f"Using Managed Identity with client ID: {client_id}")
                 credential = ManagedIdentityCredential(client_id=client_id)
-                # Test the credential to make sure it works
-                credential.get_token("https://management.azure.com/.default")
-                logger.info("Successfully authenticated with Managed Identity")
             else:
                 # Fall back to DefaultAzureCredential only if no client ID is available
                 logger.info("No client ID found, falling back to DefaultAzureCredential")
@@ -130,7 +133,7 @@ async def main():
     
     with DurableTaskSchedulerWorker(
         host_address=endpoint,
-        secure_channel=endpoint != "http://localhost:8080",
+        secure_channel=not is_local,
         taskhub=taskhub_name,
         token_credential=credential
     ) as worker:
@@ -145,10 +148,18 @@ async def main():
         worker.start()
         logger.info("Worker started. Listening for orchestrations...")
         
+        # Shared shutdown idiom across the Python samples: wait for SIGINT/SIGTERM
+        stop_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop_event.set)
+            except NotImplementedError:
+                pass  # Windows: no signal handlers, Ctrl+C raises KeyboardInterrupt
+
         try:
-            # Keep the worker running
-            while True:
-                await asyncio.sleep(1)
+            await stop_event.wait()
+            logger.info("Worker shutdown initiated")
         except KeyboardInterrupt:
             logger.info("Worker shutdown initiated")
             